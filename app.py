@@ -5,10 +5,13 @@ This is the main entry point for the web application that provides
 AI-powered career counseling analysis with interactive visualizations.
 """
 
+import html
+import threading
 import streamlit as st
 import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional, Tuple
 
 # Import our custom modules
 from src.ai_analyzer import AIAnalyzer, AnalysisResult
@@ -24,10 +27,9 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Custom CSS for better styling
-st.markdown(
-    """
-<style>
+# Custom CSS for better styling (built once at import; must still be
+# emitted on every rerun, since Streamlit drops elements not re-rendered)
+_CSS = """
     .main-header {
         font-size: 2.5rem;
         font-weight: bold;
@@ -67,10 +69,141 @@ st.markdown(
         border-radius: 0.5rem;
         margin: 0.5rem 0;
     }
-</style>
-""",
-    unsafe_allow_html=True,
+"""
+_STYLE_TAG = f"<style>{_CSS}</style>"
+
+# Pre-rendered HTML message boxes
+_HEADER_HTML = '<div class="main-header">🎯 Potential Insight Compass (PIC)</div>'
+_INTRO_BOX_HTML = """
+    <div class="info-box">
+        <strong>AIキャリア分析システム</strong><br>
+        面談記録やカウンセリングノートを分析し、隠れた強みとキャリアの可能性を発見します。
+        ネガティブな特性もポジティブな強みとして再定義し、新たな自己理解をサポートします。
+    </div>
+    """
+_SUCCESS_BOX_HTML = """
+    <div class="success-box">
+        ✅ <strong>分析完了!</strong><br>
+        分析結果が下部に表示されました。結果をスクロールして確認してください。
+    </div>
+    """
+_ERROR_BOX_TEMPLATE = """
+    <div class="warning-box">
+        ❌ <strong>エラーが発生しました</strong><br>
+        {message}
+    </div>
+    """
+_JOB_DETAILS_TEMPLATE = (
+    '<details{open} style="margin-bottom: 0.5rem;">'
+    "<summary><strong>{index}. {title}</strong></summary>"
+    "<p><strong>理由:</strong> {reason}</p>"
+    "</details>"
+)
+
+
+@st.cache_resource
+def get_analyzer() -> AIAnalyzer:
+    """Create the AI analyzer once per process."""
+    return AIAnalyzer()
+
+
+@st.cache_resource
+def get_processor() -> DataProcessor:
+    """Create the data processor once per process."""
+    return DataProcessor()
+
+
+@st.cache_resource
+def get_visualizer() -> ChartVisualizer:
+    """Create the chart visualizer once per process."""
+    return ChartVisualizer()
+
+
+# Lifetime (seconds) and size of the shared analysis result cache (the
+# export caches below keep the same number of entries)
+_ANALYSIS_CACHE_TTL = 3600
+_ANALYSIS_CACHE_SIZE = 64
+
+
+@st.cache_resource
+def get_analysis_cache() -> Tuple[OrderedDict, threading.Lock]:
+    """Create the analysis result store shared by all sessions."""
+    return OrderedDict(), threading.Lock()
+
+
+def cached_analyze(
+    text: str,
+    prompt_version: str,
+    chunk_callback: Optional[Callable[[str], None]] = None,
+    retry_callback: Optional[Callable[[int], None]] = None,
+) -> AnalysisResult:
+    """
+    Analyze text with memoization so identical inputs skip the API call.
+
+    Results are kept in a store from st.cache_resource rather than in
+    st.cache_data, which would record the streamed output written by
+    chunk_callback and replay it on every later cache hit.
+
+    Args:
+        text: Input text to analyze
+        prompt_version: System prompt version, part of the cache key
+        chunk_callback: Optional callback for each streamed text chunk
+        retry_callback: Optional callback run before each retry attempt
+
+    Returns:
+        AnalysisResult object containing the analysis results
+    """
+    entries, lock = get_analysis_cache()
+    key = (text, prompt_version)
+
+    with lock:
+        entry = entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < _ANALYSIS_CACHE_TTL:
+            entries.move_to_end(key)
+            return entry[1]
+
+    result = get_analyzer().analyze_text(
+        text, chunk_callback=chunk_callback, retry_callback=retry_callback
+    )
+
+    with lock:
+        entries[key] = (time.monotonic(), result)
+        entries.move_to_end(key)
+        while len(entries) > _ANALYSIS_CACHE_SIZE:
+            entries.popitem(last=False)
+
+    return result
+
+
+def _processed_data_key(processed_data: ProcessedData) -> tuple:
+    """Cache key for ProcessedData; the timestamp identifies each analysis."""
+    return (processed_data.timestamp, processed_data.processing_time)
+
+
+@st.cache_data(
+    show_spinner=False,
+    max_entries=_ANALYSIS_CACHE_SIZE,
+    hash_funcs={ProcessedData: _processed_data_key},
+)
+def cached_json_export(
+    processed_data: ProcessedData, _processor: DataProcessor
+) -> bytes:
+    """Serialize the JSON export once per analysis result."""
+    return _processor.export_to_json(processed_data, include_raw_text=False).encode(
+        "utf-8"
+    )
+
+
+@st.cache_data(
+    show_spinner=False,
+    max_entries=_ANALYSIS_CACHE_SIZE,
+    hash_funcs={ProcessedData: _processed_data_key},
 )
+def cached_markdown_export(
+    processed_data: ProcessedData, _processor: DataProcessor
+) -> bytes:
+    """Render the Markdown export once per analysis result."""
+    return _processor.export_to_markdown(processed_data).encode("utf-8")
 
 
 def initialize_session_state():
@@ -85,21 +218,9 @@ def initialize_session_state():
 
 def display_header():
     """Display the main header and description."""
-    st.markdown(
-        '<div class="main-header">🎯 Potential Insight Compass (PIC)</div>',
-        unsafe_allow_html=True,
-    )
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
 
-    st.markdown(
-        """
-    <div class="info-box">
-        <strong>AIキャリア分析システム</strong><br>
-        面談記録やカウンセリングノートを分析し、隠れた強みとキャリアの可能性を発見します。
-        ネガティブな特性もポジティブな強みとして再定義し、新たな自己理解をサポートします。
-    </div>
-    """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_INTRO_BOX_HTML, unsafe_allow_html=True)
 
 
 def display_sidebar():
@@ -154,7 +275,7 @@ def input_section():
         unsafe_allow_html=True,
     )
 
-    # Input text area
+    # Input text area (max_chars also shows a live character counter)
     input_text = st.text_area(
         label="面談記録・カウンセリングノート",
         height=200,
@@ -163,11 +284,6 @@ def input_section():
         help="最大10,000文字まで入力できます。より詳細な内容ほど正確な分析が可能です。",
     )
 
-    # Character count
-    if input_text:
-        char_count = len(input_text)
-        st.caption(f"文字数: {char_count:,} / 10,000")
-
     return input_text
 
 
@@ -193,8 +309,26 @@ def analysis_section(input_text: str, analyzer: AIAnalyzer, processor: DataProce
             status_text.text("📊 AI分析を実行中...")
             progress_bar.progress(25)
 
-            # Perform analysis
-            analysis_result = analyzer.analyze_text(input_text)
+            # Perform analysis (streamed output is shown while waiting)
+            stream_area = st.empty()
+            streamed = ""
+
+            def show_chunk(chunk: str) -> None:
+                nonlocal streamed
+                streamed += chunk
+                stream_area.code(streamed, language="json")
+
+            def reset_stream(attempt: int) -> None:
+                # Drop the partial output of the failed attempt
+                nonlocal streamed
+                streamed = ""
+                stream_area.empty()
+                status_text.text(f"📊 AI分析を再試行中...（{attempt}回目）")
+
+            analysis_result = cached_analyze(
+                input_text, analyzer.PROMPT_VERSION, show_chunk, reset_stream
+            )
+            stream_area.empty()
             progress_bar.progress(75)
 
             # Process data
@@ -222,29 +356,20 @@ def analysis_section(input_text: str, analyzer: AIAnalyzer, processor: DataProce
             status_text.empty()
 
             # Show success message
-            st.markdown(
-                """
-            <div class="success-box">
-                ✅ <strong>分析完了!</strong><br>
-                分析結果が下部に表示されました。結果をスクロールして確認してください。
-            </div>
-            """,
-                unsafe_allow_html=True,
-            )
+            st.markdown(_SUCCESS_BOX_HTML, unsafe_allow_html=True)
 
         except Exception as e:
             st.markdown(
-                f"""
-            <div class="warning-box">
-                ❌ <strong>エラーが発生しました</strong><br>
-                {str(e)}
-            </div>
-            """,
-                unsafe_allow_html=True,
+                _ERROR_BOX_TEMPLATE.format(message=str(e)), unsafe_allow_html=True
             )
 
 
-def display_results(processed_data: ProcessedData, visualizer: ChartVisualizer):
+@st.fragment
+def display_results(
+    processed_data: ProcessedData,
+    visualizer: ChartVisualizer,
+    processor: DataProcessor,
+):
     """Display analysis results."""
     if processed_data is None:
         return
@@ -262,25 +387,39 @@ def display_results(processed_data: ProcessedData, visualizer: ChartVisualizer):
         st.metric(label="入力文字数", value=f"{processed_data.input_length:,}")
 
     with col3:
-        avg_score = processed_data.scores_df["スコア"].mean()
+        avg_score = processed_data.scores.values.mean()
         st.metric(label="平均スコア", value=f"{avg_score:.1f}/10")
 
     with col4:
-        max_score = processed_data.scores_df["スコア"].max()
+        max_score = processed_data.scores.values.max()
         st.metric(label="最高スコア", value=f"{max_score}/10")
 
     # Qualitative Analysis
     st.markdown("### 💪 発見された強み")
 
-    for i, strength in enumerate(processed_data.strengths, 1):
-        st.markdown(f"**{i}.** {strength}")
+    st.markdown(
+        "\n\n".join(
+            f"**{i}.** {strength}"
+            for i, strength in enumerate(processed_data.strengths, 1)
+        )
+    )
 
     # Career Recommendations
     st.markdown("### 🎯 適性のある職業")
 
-    for i, job in enumerate(processed_data.potential_jobs, 1):
-        with st.expander(f"{i}. {job['job_title']}", expanded=i == 1):
-            st.write(f"**理由:** {job['reason']}")
+    # Native <details> blocks keep the collapsible behavior in one element
+    st.markdown(
+        "".join(
+            _JOB_DETAILS_TEMPLATE.format(
+                open=" open" if i == 1 else "",
+                index=i,
+                title=html.escape(job["job_title"]),
+                reason=html.escape(job["reason"]),
+            )
+            for i, job in enumerate(processed_data.potential_jobs, 1)
+        ),
+        unsafe_allow_html=True,
+    )
 
     # Quantitative Analysis
     st.markdown("### 📈 能力スコア可視化")
@@ -289,6 +428,7 @@ def display_results(processed_data: ProcessedData, visualizer: ChartVisualizer):
     tab1, tab2, tab3 = st.tabs(["🕸️ レーダーチャート", "📊 棒グラフ", "📈 統計情報"])
 
     with tab1:
+        # ChartVisualizer caches figures by input fingerprint
         radar_chart = visualizer.create_radar_chart(processed_data.scores_df)
         st.plotly_chart(radar_chart, use_container_width=True)
 
@@ -299,35 +439,27 @@ def display_results(processed_data: ProcessedData, visualizer: ChartVisualizer):
         st.plotly_chart(bar_chart, use_container_width=True)
 
     with tab3:
-        # Calculate statistics
-        from src.data_processor import DataProcessor
-
-        temp_processor = DataProcessor()
-        statistics = temp_processor.calculate_statistics(processed_data.scores_df)
+        # Calculate statistics, top strengths and development areas together
+        summary = processor.compute_all(processed_data.scores_df)
 
         col1, col2 = st.columns(2)
 
         with col1:
             st.markdown("#### 📊 統計サマリー")
-            for metric, value in statistics.items():
+            for metric, value in summary["statistics"].items():
                 st.metric(label=metric, value=f"{value:.2f}")
 
         with col2:
             st.markdown("#### 🏆 トップ3能力")
-            top_strengths = temp_processor.identify_top_strengths(
-                processed_data.scores_df
-            )
-            for i, (dimension, score) in enumerate(top_strengths, 1):
+            for i, (dimension, score) in enumerate(summary["top_strengths"], 1):
                 st.write(f"**{i}.** {dimension}: {score}/10")
 
             st.markdown("#### 🎯 成長領域")
-            development_areas = temp_processor.identify_development_areas(
-                processed_data.scores_df
-            )
-            for dimension, score in development_areas:
+            for dimension, score in summary["development_areas"]:
                 st.write(f"• {dimension}: {score}/10")
 
 
+@st.fragment
 def export_section(processed_data: ProcessedData, processor: DataProcessor):
     """Display export options."""
     if processed_data is None:
@@ -339,7 +471,7 @@ def export_section(processed_data: ProcessedData, processor: DataProcessor):
 
     with col1:
         # JSON export
-        json_data = processor.export_to_json(processed_data, include_raw_text=False)
+        json_data = cached_json_export(processed_data, processor)
         st.download_button(
             label="📄 JSON形式でダウンロード",
             data=json_data,
@@ -349,7 +481,7 @@ def export_section(processed_data: ProcessedData, processor: DataProcessor):
 
     with col2:
         # Markdown export
-        markdown_data = processor.export_to_markdown(processed_data)
+        markdown_data = cached_markdown_export(processed_data, processor)
         st.download_button(
             label="📝 Markdown形式でダウンロード",
             data=markdown_data,
@@ -358,8 +490,16 @@ def export_section(processed_data: ProcessedData, processor: DataProcessor):
         )
 
 
+def inject_css():
+    """Inject the custom stylesheet."""
+    st.markdown(_STYLE_TAG, unsafe_allow_html=True)
+
+
 def main():
     """Main application function."""
+    # Apply custom styling
+    inject_css()
+
     # Initialize session state
     initialize_session_state()
 
@@ -370,10 +510,10 @@ def main():
     display_sidebar()
 
     try:
-        # Initialize components
-        analyzer = AIAnalyzer()
-        processor = DataProcessor()
-        visualizer = ChartVisualizer()
+        # Initialize components (cached across reruns)
+        analyzer = get_analyzer()
+        processor = get_processor()
+        visualizer = get_visualizer()
 
         # Input section
         input_text = input_section()
@@ -383,7 +523,7 @@ def main():
 
         # Display results if available
         if st.session_state.processed_data:
-            display_results(st.session_state.processed_data, visualizer)
+            display_results(st.session_state.processed_data, visualizer, processor)
             export_section(st.session_state.processed_data, processor)
 
     except Exception as e:
@@ -5,17 +5,107 @@ This module handles the integration with Google Gemini API to analyze
 counseling texts and generate insights about strengths and career potential.
 """
 
-import json
+import asyncio
 import os
+import random
+import re
 import time
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 import google.generativeai as genai
+import orjson
+from google.api_core import exceptions as google_exceptions
 from dotenv import load_dotenv
 
 
-@dataclass
+MODEL_NAME = "gemini-2.5-flash"
+
+# Leading/trailing markdown code fences around a JSON response
+_CODE_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$")
+
+# Capability dimensions scored by the model, in display order
+_EXPECTED_DIMENSIONS: Tuple[str, ...] = (
+    "継続・集中力",
+    "実行・行動力",
+    "共感・協調性",
+    "論理・分析力",
+    "創造・発想力",
+    "計画・堅実性",
+)
+_EXPECTED_DIMENSIONS_SET = frozenset(_EXPECTED_DIMENSIONS)
+
+# Structured-output schema so the API returns bare JSON in the expected shape,
+# including the 5 strengths and 3 jobs that _validate_response_structure checks
+RESPONSE_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "qualitative_analysis": {
+            "type": "OBJECT",
+            "properties": {
+                "strengths": {
+                    "type": "ARRAY",
+                    "items": {"type": "STRING"},
+                    "min_items": 5,
+                    "max_items": 5,
+                },
+                "potential_jobs": {
+                    "type": "ARRAY",
+                    "items": {
+                        "type": "OBJECT",
+                        "properties": {
+                            "job_title": {"type": "STRING"},
+                            "reason": {"type": "STRING"},
+                        },
+                        "required": ["job_title", "reason"],
+                    },
+                    "min_items": 3,
+                    "max_items": 3,
+                },
+            },
+            "required": ["strengths", "potential_jobs"],
+        },
+        "quantitative_scores": {
+            "type": "OBJECT",
+            "properties": {d: {"type": "INTEGER"} for d in _EXPECTED_DIMENSIONS},
+            "required": list(_EXPECTED_DIMENSIONS),
+        },
+    },
+    "required": ["qualitative_analysis", "quantitative_scores"],
+}
+
+GENERATION_CONFIG = genai.GenerationConfig(
+    response_mime_type="application/json",
+    response_schema=RESPONSE_SCHEMA,
+)
+
+# Transient API errors worth retrying
+RETRYABLE_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.DeadlineExceeded,
+    google_exceptions.InternalServerError,
+)
+
+# Errors that trigger another attempt: transient API errors, plus ValueError
+# from a malformed or incomplete response, which the next sample usually
+# fixes. Input is validated before the first attempt, so invalid input and
+# auth errors still fail fast.
+_RETRY_ERRORS = (*RETRYABLE_ERRORS, ValueError)
+
+# Guard so that .env is parsed only once per process
+_ENV_LOADED = False
+
+
+def _load_env_once() -> None:
+    """Load environment variables from .env on first call only."""
+    global _ENV_LOADED
+    if not _ENV_LOADED:
+        load_dotenv()
+        _ENV_LOADED = True
+
+
+@dataclass(frozen=True, slots=True)
 class AnalysisResult:
     """Data class to hold analysis results."""
 
@@ -36,6 +126,74 @@ class AIAnalyzer:
     - Generates quantitative scores across 6 capability dimensions
     """
 
+    # Bump whenever SYSTEM_PROMPT or FEW_SHOT_CONTENTS change so cached
+    # analyses are invalidated
+    PROMPT_VERSION = "2"
+
+    # System instruction based on SPECIFICATION.md. The output format is
+    # enforced by RESPONSE_SCHEMA, so it is not spelled out here.
+    SYSTEM_PROMPT = """あなたはプロのキャリア戦略家です。自信を失ったクライアントの面談記録を分析し、隠れた才能を客観的に示してください。
+
+1. ネガティブな表現はすべてポジティブな強みにリフレーミングする。
+2. リフレーミング後の強みを5つ、その強みを活かせる職業を理由付きで3つ挙げる。
+3. 次の6軸をそれぞれ1〜10の整数で採点する。
+   継続・集中力（没頭度・忍耐力）、実行・行動力（決断の速さ・行動への移行性）、
+   共感・協調性（他者への配慮・傾聴力・感受性）、論理・分析力（構造的把握・原因追及・数値的思考）、
+   創造・発想力（独自の視点・趣味や芸術性）、計画・堅実性（慎重さ・不安感＝リスク管理・安定志向）
+4. JSONのみを出力する。"""
+
+    # One worked example showing the negative-to-positive reframing
+    FEW_SHOT_CONTENTS = [
+        {
+            "role": "user",
+            "parts": [
+                "## 分析対象テキスト\n"
+                "人見知りで、何をやっても続かず飽きっぽい。"
+                "休日はゲームばかりしていて、将来が不安です。"
+            ],
+        },
+        {
+            "role": "model",
+            "parts": [
+                orjson.dumps(
+                    {
+                        "qualitative_analysis": {
+                            "strengths": [
+                                "思慮深く、一つのことに高い集中力を発揮できる",
+                                "好奇心が旺盛で、新しい分野に素早く踏み出せる",
+                                "行動の切り替えが早く、状況に柔軟に対応できる",
+                                "ゲームで培った高い攻略（戦略）能力",
+                                "将来を見据えてリスクを管理する慎重さ",
+                            ],
+                            "potential_jobs": [
+                                {
+                                    "job_title": "データアナリスト",
+                                    "reason": "集中力と攻略的な思考でデータから課題を読み解ける",
+                                },
+                                {
+                                    "job_title": "Webディレクター",
+                                    "reason": "好奇心と切り替えの早さで多様な案件を推進できる",
+                                },
+                                {
+                                    "job_title": "品質保証（QA）エンジニア",
+                                    "reason": "慎重さと攻略力で不具合やリスクを先回りして発見できる",
+                                },
+                            ],
+                        },
+                        "quantitative_scores": {
+                            "継続・集中力": 7,
+                            "実行・行動力": 6,
+                            "共感・協調性": 5,
+                            "論理・分析力": 7,
+                            "創造・発想力": 6,
+                            "計画・堅実性": 8,
+                        },
+                    }
+                ).decode()
+            ],
+        },
+    ]
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize the AI Analyzer.
@@ -44,7 +202,7 @@ class AIAnalyzer:
             api_key: Google Gemini API key. If None, loads from environment.
         """
         # Load environment variables
-        load_dotenv()
+        _load_env_once()
 
         # Set up API key
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
@@ -57,83 +215,19 @@ class AIAnalyzer:
         genai.configure(api_key=self.api_key)
 
         # Initialize the model
-        self.model = genai.GenerativeModel("gemini-2.5-flash")
+        # System prompt is a class-level constant; no per-instance rebuild
+        self.system_prompt = self.SYSTEM_PROMPT
 
-        # Define system prompt based on SPECIFICATION.md
-        self.system_prompt = self._build_system_prompt()
+        # Initialize the model with the system prompt as system instruction
+        self.model = genai.GenerativeModel(
+            MODEL_NAME,
+            system_instruction=self.system_prompt,
+            generation_config=GENERATION_CONFIG,
+        )
 
     def _build_system_prompt(self) -> str:
         """Build the system prompt based on specifications."""
-        return """あなたは、高度な『共感力』と『鋭い分析眼』を持つ、『プロフェッショナル・キャリア戦略家』です。
-あなたの『任務』は、ユーザー（キャリアカウンセラー等）が入力した、『自信』を失ったクライアント（診断対象者）の『面談記録』を分析することです。
-
-以下の『厳格なルール』に従い、クライアントの『隠された才能』を『翻訳』し、『客観的』な分析結果を提供しなさい。
-
-## 厳格なルール
-
-1.  **【ネガティブ・ポジティブ リフレーミング】:**
-    入力テキストに含まれる、いかなる『ネガティブ』な表現（例：「人見知りだ」「続かない」「飽きっぽい」「ゲームばかりしている」「不安だ」）も、
-    『すべて』、客観的かつ『ポジティブ』な『強み（ポテンシャル）』として『再定義（リフレーミング）』しなさい。
-    （例：「人見知り」→「高い集中力を持つ」「思慮深い」）
-    （例：「飽きっぽい」→「好奇心が旺盛」「行動の切り替えが早い」）
-    （例：「ゲームばかり」→「高い攻略（戦略）能力」「継続的な実行力」）
-
-2.  **【2種類の分析結果の生成】:**
-    あなたの分析結果は、以下の「A」と「B」の「2種類」を『必ず』生成しなければなりません。
-
-    * **A: 『定性的』分析（文章）:**
-        * クライアントの『強み（再定義後）』を『5つ』、箇条書きで『抽出』しなさい。
-        * その『強み』を活かせると『判断』した、『3つ』の『職業適性の可能性』を、その『理由』と共に『提示』しなさい。
-
-    * **B: 『定量的』分析（スコア）:**
-        * 入力テキストから、クライアントの『潜在能力』を以下の『6つ』の『軸』で『分析』し、それぞれ『10点満点（整数）』で『採点』しなさい。
-        * **『6つ』の『軸』:**
-            1.  **【継続・集中力】:** （一つのことへの没頭度、忍耐力）
-            2.  **【実行・行動力】:** （決断の速さ、行動への移行性）
-            3.  **【共感・協調性】:** （他者への配慮、傾聴力、感受性）
-            4.  **【論理・分析力】:** （構造的把握、原因追及、数値的思考）
-            5.  **【創造・発想力】:** （独自の視点、趣味や芸術性）
-            6.  **【計画・堅実性】:** （慎重さ、不安感（＝リスク管理）、安定志向）
-
-3.  **【出力フォーマット（厳格）】:**
-    あなたの『回答』は、『単一』の『JSONオブジェクト』『のみ』で『出力』すること。
-    JSONの前後に、解説文やマークダウン指定（例: ```json）を『一切』、『含めてはならない』。
-
-## 出力JSONフォーマット
-
-{
-  "qualitative_analysis": {
-    "strengths": [
-      "（ここに『翻訳』した『強み』1）",
-      "（ここに『翻訳』した『強み』2）",
-      "（ここに『翻訳』した『強み』3）",
-      "（ここに『翻訳』した『強み』4）",
-      "（ここに『翻訳』した『強み』5）"
-    ],
-    "potential_jobs": [
-      {
-        "job_title": "（ここに『職業の可能性』1）",
-        "reason": "（ここに、その『理由』）"
-      },
-      {
-        "job_title": "（ここに『職業の可能性』2）",
-        "reason": "（ここに、その『理由』）"
-      },
-      {
-        "job_title": "（ここに『職業の可能性』3）",
-        "reason": "（ここに、その『理由』）"
-      }
-    ]
-  },
-  "quantitative_scores": {
-    "継続・集中力": （ここに1から10の『整数』）,
-    "実行・行動力": （ここに1から10の『整数』）,
-    "共感・協調性": （ここに1から10の『整数』）,
-    "論理・分析力": （ここに1から10の『整数』）,
-    "創造・発想力": （ここに1から10の『整数』）,
-    "計画・堅実性": （ここに1から10の『整数』）
-  }
-}"""
+        return self.SYSTEM_PROMPT
 
     def validate_input(self, text: str) -> Tuple[bool, str]:
         """
@@ -145,33 +239,58 @@ class AIAnalyzer:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if not text or not text.strip():
+        n = len(text) if text else 0
+
+        # Measure the stripped length without allocating a stripped copy
+        start = 0
+        while start < n and text[start].isspace():
+            start += 1
+        end = n
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        stripped_length = end - start
+
+        if stripped_length == 0:
             return False, "入力テキストが空です。分析対象のテキストを入力してください。"
 
-        if len(text.strip()) < 10:
+        if stripped_length < 10:
             return False, "入力テキストが短すぎます。より詳細な内容を入力してください。"
 
-        if len(text) > 10000:
+        if n > 10000:
             return (
                 False,
-                f"入力テキストが長すぎます。{len(text)}文字ですが、上限は10,000文字です。",
+                f"入力テキストが長すぎます。{n}文字ですが、上限は10,000文字です。",
             )
 
         return True, ""
 
-    def analyze_text(self, text: str, max_retries: int = 3) -> AnalysisResult:
+    def analyze_text(
+        self,
+        text: str,
+        max_retries: int = 3,
+        chunk_callback: Optional[Callable[[str], None]] = None,
+        retry_callback: Optional[Callable[[int], None]] = None,
+    ) -> AnalysisResult:
         """
         Analyze the input text using Gemini API.
 
+        The response is streamed; if chunk_callback is given it is called with
+        the text of each chunk as it arrives. Before a retry, retry_callback
+        is called with the attempt number, so that chunks already received
+        from the failed attempt can be discarded.
+
         Args:
             text: Input text to analyze
             max_retries: Maximum number of retry attempts
+            chunk_callback: Optional callback for each streamed text chunk
+            retry_callback: Optional callback run before each retry attempt
 
         Returns:
             AnalysisResult object containing the analysis results
 
         Raises:
-            ValueError: If input validation fails
+            ValueError: If input validation fails, or the response is still
+                invalid after the last retry
             Exception: If API call fails after retries
         """
         # Validate input
@@ -181,41 +300,146 @@ class AIAnalyzer:
 
         start_time = time.time()
 
-        # Prepare the prompt
-        full_prompt = f"{self.system_prompt}\n\n## 分析対象テキスト\n{text}"
-
         # Attempt API call with retries
         for attempt in range(max_retries):
             try:
-                response = self.model.generate_content(full_prompt)
-                raw_response = response.text
-
-                # Parse JSON response
-                analysis_data = self._parse_response(raw_response)
+                contents = self._build_contents(text)
+                response = self.model.generate_content(contents, stream=True)
 
-                processing_time = time.time() - start_time
+                # Collect streamed chunks
+                chunks = []
+                for chunk in response:
+                    chunks.append(chunk.text)
+                    if chunk_callback:
+                        chunk_callback(chunk.text)
+                raw_response = "".join(chunks)
 
-                return AnalysisResult(
-                    strengths=analysis_data["qualitative_analysis"]["strengths"],
-                    potential_jobs=analysis_data["qualitative_analysis"][
-                        "potential_jobs"
-                    ],
-                    quantitative_scores=analysis_data["quantitative_scores"],
-                    raw_response=raw_response,
-                    processing_time=processing_time,
-                )
+                return self._build_result(raw_response, start_time)
 
-            except Exception as e:
+            except _RETRY_ERRORS as e:
                 if attempt == max_retries - 1:
+                    if isinstance(e, ValueError):
+                        raise
                     raise Exception(
                         f"API呼び出しが失敗しました（{max_retries}回試行）: {str(e)}"
                     )
 
-                # Wait before retry (exponential backoff)
-                wait_time = 2**attempt
-                time.sleep(wait_time)
+                # Wait before retry (exponential backoff with full jitter)
+                time.sleep(random.uniform(0, 2**attempt))
+                if retry_callback:
+                    retry_callback(attempt + 2)
                 continue
 
+    async def analyze_batch(
+        self, texts: List[str], max_concurrency: int = 8
+    ) -> List[AnalysisResult]:
+        """
+        Analyze multiple texts concurrently.
+
+        Args:
+            texts: Input texts to analyze
+            max_concurrency: Maximum number of in-flight API calls
+
+        Returns:
+            List of AnalysisResult objects in the same order as texts
+
+        Raises:
+            ValueError: If input validation fails, or a response is still
+                invalid after the last retry, for any text
+            Exception: If an API call fails after retries
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(text: str) -> AnalysisResult:
+            async with semaphore:
+                return await self.analyze_text_async(text)
+
+        return await asyncio.gather(*(run(text) for text in texts))
+
+    async def analyze_text_async(
+        self, text: str, max_retries: int = 3
+    ) -> AnalysisResult:
+        """
+        Analyze the input text using the async Gemini API.
+
+        Args:
+            text: Input text to analyze
+            max_retries: Maximum number of retry attempts
+
+        Returns:
+            AnalysisResult object containing the analysis results
+
+        Raises:
+            ValueError: If input validation fails, or the response is still
+                invalid after the last retry
+            Exception: If API call fails after retries
+        """
+        # Validate input
+        is_valid, error_msg = self.validate_input(text)
+        if not is_valid:
+            raise ValueError(error_msg)
+
+        start_time = time.time()
+
+        # Attempt API call with retries
+        for attempt in range(max_retries):
+            try:
+                contents = self._build_contents(text)
+                response = await self.model.generate_content_async(contents)
+
+                return self._build_result(response.text, start_time)
+
+            except _RETRY_ERRORS as e:
+                if attempt == max_retries - 1:
+                    if isinstance(e, ValueError):
+                        raise
+                    raise Exception(
+                        f"API呼び出しが失敗しました（{max_retries}回試行）: {str(e)}"
+                    )
+
+                # Wait before retry without blocking the event loop
+                await asyncio.sleep(random.uniform(0, 2**attempt))
+
+    def _build_contents(self, text: str) -> List[Dict[str, Any]]:
+        """
+        Build the request contents: the few-shot example, then the input text.
+
+        The system prompt and example are sent with every request. Together
+        they are well below Gemini's minimum size (1,024 tokens) for context
+        caching, so they cannot be cached server-side.
+
+        Args:
+            text: Input text to analyze
+
+        Returns:
+            List of content dicts for generate_content
+        """
+        user_content = {"role": "user", "parts": [f"## 分析対象テキスト\n{text}"]}
+        return [*self.FEW_SHOT_CONTENTS, user_content]
+
+    def _build_result(self, raw_response: str, start_time: float) -> AnalysisResult:
+        """
+        Parse a raw API response into an AnalysisResult.
+
+        Args:
+            raw_response: Raw response text from API
+            start_time: Time the analysis started (time.time())
+
+        Returns:
+            AnalysisResult object containing the analysis results
+        """
+        analysis_data = self._parse_response(raw_response)
+
+        processing_time = time.time() - start_time
+
+        return AnalysisResult(
+            strengths=analysis_data["qualitative_analysis"]["strengths"],
+            potential_jobs=analysis_data["qualitative_analysis"]["potential_jobs"],
+            quantitative_scores=analysis_data["quantitative_scores"],
+            raw_response=raw_response,
+            processing_time=processing_time,
+        )
+
     def _parse_response(self, response_text: str) -> Dict:
         """
         Parse the JSON response from Gemini API.
@@ -229,28 +453,32 @@ class AIAnalyzer:
         Raises:
             ValueError: If JSON parsing fails
         """
-        try:
-            # Clean the response text (remove any markdown formatting)
-            cleaned_response = response_text.strip()
-            if cleaned_response.startswith("```json"):
-                cleaned_response = cleaned_response[7:]
-            if cleaned_response.endswith("```"):
-                cleaned_response = cleaned_response[:-3]
-            cleaned_response = cleaned_response.strip()
+        data = None
 
-            # Parse JSON
-            data = json.loads(cleaned_response)
+        # Structured output is bare JSON, so try it as-is first
+        try:
+            data = orjson.loads(response_text)
+        except orjson.JSONDecodeError:
+            pass
 
-            # Validate structure
-            self._validate_response_structure(data)
+        try:
+            if data is None:
+                # Clean the response text (remove any markdown formatting)
+                cleaned_response = _CODE_FENCE_RE.sub("", response_text)
 
-            return data
+                # Parse JSON (orjson decodes in C without Python-level escaping)
+                data = orjson.loads(cleaned_response)
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise ValueError(
                 f"JSON解析に失敗しました: {str(e)}\nレスポンス: {response_text[:500]}"
             )
 
+        # Validate structure
+        self._validate_response_structure(data)
+
+        return data
+
     def _validate_response_structure(self, data: Dict) -> None:
         """
         Validate the structure of parsed response data.
@@ -279,24 +507,21 @@ class AIAnalyzer:
 
         # Validate quantitative scores
         quant_scores = data["quantitative_scores"]
-        expected_dimensions = [
-            "継続・集中力",
-            "実行・行動力",
-            "共感・協調性",
-            "論理・分析力",
-            "創造・発想力",
-            "計画・堅実性",
-        ]
-
-        for dimension in expected_dimensions:
-            if dimension not in quant_scores:
-                raise ValueError(f"能力次元 '{dimension}' がスコアに含まれていません")
-
-            score = quant_scores[dimension]
-            if not isinstance(score, int) or score < 1 or score > 10:
-                raise ValueError(
-                    f"スコア '{dimension}' は1-10の整数である必要があります"
-                )
+        if not _EXPECTED_DIMENSIONS_SET <= quant_scores.keys():
+            missing = next(d for d in _EXPECTED_DIMENSIONS if d not in quant_scores)
+            raise ValueError(f"能力次元 '{missing}' がスコアに含まれていません")
+
+        invalid = next(
+            (
+                d
+                for d in _EXPECTED_DIMENSIONS
+                if not isinstance(quant_scores[d], int)
+                or not 1 <= quant_scores[d] <= 10
+            ),
+            None,
+        )
+        if invalid is not None:
+            raise ValueError(f"スコア '{invalid}' は1-10の整数である必要があります")
 
     def get_capability_dimensions(self) -> List[str]:
         """
@@ -305,11 +530,4 @@ class AIAnalyzer:
         Returns:
             List of capability dimension names
         """
-        return [
-            "継続・集中力",
-            "実行・行動力",
-            "共感・協調性",
-            "論理・分析力",
-            "創造・発想力",
-            "計画・堅実性",
-        ]
+        return list(_EXPECTED_DIMENSIONS)
@@ -5,16 +5,143 @@ This module handles data processing, validation, and transformation
 for the Potential Insight Compass system.
 """
 
-import json
+import functools
+import math
+import numbers
 import re
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 
+import numpy as np
+import orjson
 import pandas as pd
 
 
-@dataclass
+# Whitespace runs and repeated punctuation, normalized in a single pass.
+# \s covers the full-width space (U+3000); lone ASCII spaces are already
+# normalized, so only runs and other whitespace characters are matched.
+_RE_NORMALIZE = re.compile(r"(\s{2,}|[^\S ])|(！{2,})|(？{2,})|(。{2,})")
+
+# Replacement for each capture group of _RE_NORMALIZE (index = group number)
+_NORMALIZE_REPLACEMENTS = (None, " ", "！", "？", "。")
+
+# Smart quotes mapped to their ASCII equivalents
+_QUOTE_TABLE = str.maketrans(
+    {"\u201c": '"', "\u201d": '"', "\u2018": "'", "\u2019": "'"}
+)
+
+# Markdown score bars for every possible score 0-10
+_BARS = tuple("█" * i + "░" * (10 - i) for i in range(11))
+
+# Inputs longer than this are preprocessed without being cached
+_PREPROCESS_CACHE_MAX_LENGTH = 100_000
+
+
+def _normalize_match(match: re.Match) -> str:
+    """Return the replacement for a _RE_NORMALIZE match."""
+    return _NORMALIZE_REPLACEMENTS[match.lastindex]
+
+
+def _preprocess(text: str) -> str:
+    """Normalize whitespace, repeated punctuation and quotation marks."""
+    # Normalize whitespace/line breaks and remove excessive punctuation
+    processed_text = _RE_NORMALIZE.sub(_normalize_match, text.strip())
+
+    # Normalize quotation marks
+    return processed_text.translate(_QUOTE_TABLE)
+
+
+# Resubmitted texts (retries, small edits undone) skip the regex work
+_preprocess_cached = functools.lru_cache(maxsize=128)(_preprocess)
+
+
+@functools.lru_cache(maxsize=None)
+def _dimension_dtype(dimensions: Tuple[str, ...]) -> pd.CategoricalDtype:
+    """Categorical dtype for a dimension tuple, shared by every DataFrame."""
+    return pd.CategoricalDtype(dimensions)
+
+
+def _select_ranked(
+    values: np.ndarray, dimensions: np.ndarray, n: int, largest: bool
+) -> List[Tuple[str, int]]:
+    """
+    Select the n highest (or lowest) scores without sorting the DataFrame.
+
+    Args:
+        values: Score column as an array
+        dimensions: Dimension column as an array, parallel to values
+        n: Number of entries to return
+        largest: True for the highest scores, False for the lowest
+
+    Returns:
+        List of tuples (dimension_name, score) ordered by rank
+    """
+    n = min(n, len(values))
+    if n <= 0:
+        return []
+
+    # Rank key: ascending order of keys = rank order. A stable sort keeps tied
+    # scores in dimension order, including ties across the n-th boundary.
+    keys = -values.astype(np.int64) if largest else values.astype(np.int64)
+    idx = np.argsort(keys, kind="stable")[:n]
+
+    return list(zip(dimensions[idx].tolist(), values[idx].tolist()))
+
+
+def _statistics(values: np.ndarray) -> Dict[str, float]:
+    """Statistical measures of a score array (see calculate_statistics)."""
+    scores = np.asarray(values, dtype=np.float64)
+
+    # Compute each reduction once and derive the rest from it;
+    # min, median and max share a single partition
+    minimum, median, maximum = np.quantile(scores, [0.0, 0.5, 1.0])
+    total = scores.sum()
+    mean = total / scores.size
+    # Population standard deviation (ddof=0), as numpy's std() default
+    std = math.sqrt(((scores - mean) ** 2).sum() / scores.size)
+
+    return {
+        "平均値": float(mean),
+        "最大値": float(maximum),
+        "最小値": float(minimum),
+        "標準偏差": float(std),
+        "中央値": float(median),
+        "合計値": float(total),
+        "レンジ": float(maximum - minimum),
+    }
+
+
+@dataclass(frozen=True, eq=False)
+class Scores:
+    """Capability scores as parallel dimension/value arrays."""
+
+    dimensions: Tuple[str, ...]
+    values: np.ndarray
+
+    def to_dict(self) -> Dict[str, int]:
+        """Return the scores as a {dimension: score} dictionary."""
+        return dict(zip(self.dimensions, self.values.tolist()))
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Build the DataFrame used for visualization."""
+        # Dimensions are stored as int8 category codes, one row per category
+        dimensions = pd.Categorical.from_codes(
+            np.arange(len(self.dimensions), dtype=np.int8),
+            dtype=_dimension_dtype(self.dimensions),
+        )
+        return pd.DataFrame(
+            {
+                "能力次元": dimensions,
+                "スコア": self.values,
+                "最大値": np.full(len(self.values), 10, dtype=np.int8),
+                # s / 10 * 100 == s * 10, exact in float32 for scores 0-10
+                "パーセンテージ": self.values.astype(np.float32) * 10,
+            }
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class ProcessedData:
     """Data class for processed analysis data."""
 
@@ -23,9 +150,20 @@ class ProcessedData:
     input_length: int
     strengths: List[str]
     potential_jobs: List[Dict[str, str]]
-    scores_df: pd.DataFrame
+    scores: Scores
     processing_time: float
     metadata: Dict[str, Any]
+    _scores_df: Optional[pd.DataFrame] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def scores_df(self) -> pd.DataFrame:
+        """Scores as a DataFrame, built on first access."""
+        if self._scores_df is None:
+            # Memoize into the slot despite frozen=True
+            object.__setattr__(self, "_scores_df", self.scores.to_dataframe())
+        return self._scores_df
 
 
 class DataProcessor:
@@ -39,18 +177,19 @@ class DataProcessor:
     - Export functionality
     """
 
-    def __init__(self):
-        """Initialize the data processor."""
-        self.capability_dimensions = [
-            "継続・集中力",
-            "実行・行動力",
-            "共感・協調性",
-            "論理・分析力",
-            "創造・発想力",
-            "計画・堅実性",
-        ]
-
-    def preprocess_text(self, text: str) -> str:
+    # Capability dimensions in display order, shared by all instances
+    CAPABILITY_DIMENSIONS: Tuple[str, ...] = (
+        "継続・集中力",
+        "実行・行動力",
+        "共感・協調性",
+        "論理・分析力",
+        "創造・発想力",
+        "計画・堅実性",
+    )
+    _DIM_SET = frozenset(CAPABILITY_DIMENSIONS)
+
+    @staticmethod
+    def preprocess_text(text: str) -> str:
         """
         Preprocess input text for analysis.
 
@@ -63,26 +202,20 @@ class DataProcessor:
         if not text:
             return ""
 
-        # Normalize whitespace and line breaks
-        processed_text = re.sub(r"\s+", " ", text.strip())
-
-        # Remove excessive punctuation
-        processed_text = re.sub(r"[！]{2,}", "！", processed_text)
-        processed_text = re.sub(r"[？]{2,}", "？", processed_text)
-        processed_text = re.sub(r"[。]{2,}", "。", processed_text)
-
-        # Normalize quotation marks
-        processed_text = processed_text.replace('"', '"').replace('"', '"')
-        processed_text = processed_text.replace(""", "'").replace(""", "'")
-
-        return processed_text
+        if len(text) > _PREPROCESS_CACHE_MAX_LENGTH:
+            return _preprocess(text)
+        return _preprocess_cached(text)
 
-    def validate_analysis_data(self, data: Dict) -> Tuple[bool, List[str]]:
+    @classmethod
+    def validate_analysis_data(
+        cls, data: Dict, fast_fail: bool = False
+    ) -> Tuple[bool, List[str]]:
         """
         Validate analysis data structure and content.
 
         Args:
             data: Analysis data dictionary
+            fast_fail: Stop at the first error instead of collecting all of them
 
         Returns:
             Tuple of (is_valid, list_of_errors)
@@ -97,6 +230,8 @@ class DataProcessor:
         # Check qualitative analysis
         if "qualitative_analysis" not in data:
             errors.append("定性分析データが見つかりません")
+            if fast_fail:
+                return False, errors
         else:
             qual_data = data["qualitative_analysis"]
 
@@ -109,6 +244,8 @@ class DataProcessor:
                 errors.append(
                     f"強みは5項目である必要があります（現在: {len(qual_data['strengths'])}項目）"
                 )
+            if fast_fail and errors:
+                return False, errors
 
             # Check potential jobs
             if "potential_jobs" not in qual_data:
@@ -127,6 +264,10 @@ class DataProcessor:
                         errors.append(
                             f"職業適性{i+1}にjob_titleまたはreasonが不足しています"
                         )
+                    if fast_fail and errors:
+                        return False, errors
+            if fast_fail and errors:
+                return False, errors
 
         # Check quantitative scores
         if "quantitative_scores" not in data:
@@ -136,8 +277,9 @@ class DataProcessor:
             if not isinstance(scores, dict):
                 errors.append("定量分析データが辞書形式ではありません")
             else:
-                for dimension in self.capability_dimensions:
-                    if dimension not in scores:
+                missing = cls._DIM_SET - scores.keys()
+                for dimension in cls.CAPABILITY_DIMENSIONS:
+                    if dimension in missing:
                         errors.append(f"能力次元 '{dimension}' が見つかりません")
                     else:
                         score = scores[dimension]
@@ -147,35 +289,66 @@ class DataProcessor:
                             errors.append(
                                 f"'{dimension}' のスコアが範囲外です（1-10の間である必要があります）"
                             )
+                    if fast_fail and errors:
+                        return False, errors
 
         return len(errors) == 0, errors
 
-    def create_scores_dataframe(self, scores: Dict[str, int]) -> pd.DataFrame:
+    @classmethod
+    def create_scores(cls, scores: Dict[str, int]) -> Scores:
         """
-        Create a pandas DataFrame from capability scores.
+        Create a Scores object from capability scores.
 
         Args:
             scores: Dictionary of capability scores
 
         Returns:
-            DataFrame with scores for visualization
+            Scores with one entry per capability dimension (missing = 0)
+
+        Raises:
+            ValueError: If a score is not an integer from 0 to 10
         """
-        # Create DataFrame
-        df = pd.DataFrame(
-            [
-                {"能力次元": dimension, "スコア": scores.get(dimension, 0)}
-                for dimension in self.capability_dimensions
-            ]
+        values = []
+        for dimension in cls.CAPABILITY_DIMENSIONS:
+            score = scores.get(dimension, 0)
+            # Scores are packed into int8, which would silently truncate
+            # fractions and overflow outside its range; integral floats
+            # such as 7.0 are accepted
+            if (
+                isinstance(score, bool)
+                or not isinstance(score, numbers.Real)
+                or not float(score).is_integer()
+                or not 0 <= score <= 10
+            ):
+                raise ValueError(
+                    f"スコア '{dimension}' は0-10の整数である必要があります: {score!r}"
+                )
+            values.append(int(score))
+
+        return Scores(
+            dimensions=cls.CAPABILITY_DIMENSIONS,
+            values=np.array(values, dtype=np.int8),
         )
 
-        # Add additional columns for visualization
-        df["最大値"] = 10
-        df["パーセンテージ"] = (df["スコア"] / 10) * 100
+    @classmethod
+    def create_scores_dataframe(cls, scores: Dict[str, int]) -> pd.DataFrame:
+        """
+        Create a pandas DataFrame from capability scores.
 
-        return df
+        Args:
+            scores: Dictionary of capability scores
 
+        Returns:
+            DataFrame with scores for visualization
+
+        Raises:
+            ValueError: If a score is not an integer from 0 to 10
+        """
+        return cls.create_scores(scores).to_dataframe()
+
+    @classmethod
     def process_analysis_result(
-        self,
+        cls,
         input_text: str,
         analysis_result: Any,
         additional_metadata: Optional[Dict] = None,
@@ -191,13 +364,17 @@ class DataProcessor:
         Returns:
             ProcessedData object with structured data
         """
-        # Create scores DataFrame
-        scores_df = self.create_scores_dataframe(analysis_result.quantitative_scores)
+        # Create scores (the DataFrame is built lazily by ProcessedData)
+        scores = cls.create_scores(analysis_result.quantitative_scores)
+
+        # Single timestamp and length shared by metadata and ProcessedData
+        timestamp = datetime.now().isoformat()
+        input_length = len(input_text)
 
         # Prepare metadata
         metadata = {
-            "analysis_timestamp": datetime.now().isoformat(),
-            "input_character_count": len(input_text),
+            "analysis_timestamp": timestamp,
+            "input_character_count": input_length,
             "processing_time_seconds": analysis_result.processing_time,
             "api_response_length": len(analysis_result.raw_response),
         }
@@ -206,18 +383,19 @@ class DataProcessor:
             metadata.update(additional_metadata)
 
         return ProcessedData(
-            timestamp=datetime.now().isoformat(),
-            input_text=self.preprocess_text(input_text),
-            input_length=len(input_text),
+            timestamp=timestamp,
+            input_text=cls.preprocess_text(input_text),
+            input_length=input_length,
             strengths=analysis_result.strengths,
             potential_jobs=analysis_result.potential_jobs,
-            scores_df=scores_df,
+            scores=scores,
             processing_time=analysis_result.processing_time,
             metadata=metadata,
         )
 
+    @staticmethod
     def export_to_json(
-        self, processed_data: ProcessedData, include_raw_text: bool = False
+        processed_data: ProcessedData, include_raw_text: bool = False
     ) -> str:
         """
         Export processed data to JSON format.
@@ -235,18 +413,22 @@ class DataProcessor:
             "processing_time": processed_data.processing_time,
             "strengths": processed_data.strengths,
             "potential_jobs": processed_data.potential_jobs,
-            "quantitative_scores": processed_data.scores_df[["能力次元", "スコア"]]
-            .set_index("能力次元")["スコア"]
-            .to_dict(),
+            "quantitative_scores": processed_data.scores.to_dict(),
             "metadata": processed_data.metadata,
         }
 
         if include_raw_text:
             export_dict["input_text"] = processed_data.input_text
 
-        return json.dumps(export_dict, ensure_ascii=False, indent=2)
+        return orjson.dumps(
+            export_dict,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY,
+        ).decode()
 
-    def export_to_markdown(self, processed_data: ProcessedData) -> str:
+    @staticmethod
+    def export_to_markdown(processed_data: ProcessedData) -> str:
         """
         Export processed data to Markdown format.
 
@@ -256,7 +438,8 @@ class DataProcessor:
         Returns:
             Markdown string representation
         """
-        md_content = f"""# 潜在能力分析結果レポート
+        parts: List[str] = [
+            f"""# 潜在能力分析結果レポート
 
 ## 📊 分析概要
 
@@ -267,28 +450,29 @@ class DataProcessor:
 ## 💪 発見された強み
 
 """
+        ]
 
         for i, strength in enumerate(processed_data.strengths, 1):
-            md_content += f"{i}. {strength}\n"
+            parts.append(f"{i}. {strength}\n")
 
-        md_content += "\n## 🎯 適性のある職業\n\n"
+        parts.append("\n## 🎯 適性のある職業\n\n")
 
         for i, job in enumerate(processed_data.potential_jobs, 1):
-            md_content += f"### {i}. {job['job_title']}\n\n"
-            md_content += f"**理由**: {job['reason']}\n\n"
+            parts.append(f"### {i}. {job['job_title']}\n\n")
+            parts.append(f"**理由**: {job['reason']}\n\n")
 
-        md_content += "## 📈 能力スコア\n\n"
+        parts.append("## 📈 能力スコア\n\n")
 
-        for _, row in processed_data.scores_df.iterrows():
-            dimension = row["能力次元"]
-            score = row["スコア"]
-            percentage = row["パーセンテージ"]
-            bar = "█" * int(percentage // 10) + "░" * (10 - int(percentage // 10))
-            md_content += f"**{dimension}**: {score}/10 `{bar}` ({percentage:.0f}%)\n\n"
+        scores = processed_data.scores
+        for dimension, score in zip(scores.dimensions, scores.values.tolist()):
+            percentage = score * 10
+            bar = _BARS[min(max(int(score), 0), 10)]
+            parts.append(f"**{dimension}**: {score}/10 `{bar}` ({percentage:.0f}%)\n\n")
 
-        return md_content
+        return "".join(parts)
 
-    def calculate_statistics(self, scores_df: pd.DataFrame) -> Dict[str, float]:
+    @staticmethod
+    def calculate_statistics(scores_df: pd.DataFrame) -> Dict[str, float]:
         """
         Calculate statistical measures from scores.
 
@@ -298,20 +482,11 @@ class DataProcessor:
         Returns:
             Dictionary with statistical measures
         """
-        scores = scores_df["スコア"].values
-
-        return {
-            "平均値": float(scores.mean()),
-            "最大値": float(scores.max()),
-            "最小値": float(scores.min()),
-            "標準偏差": float(scores.std()),
-            "中央値": float(pd.Series(scores).median()),
-            "合計値": float(scores.sum()),
-            "レンジ": float(scores.max() - scores.min()),
-        }
+        return _statistics(scores_df["スコア"].to_numpy())
 
+    @staticmethod
     def identify_top_strengths(
-        self, scores_df: pd.DataFrame, top_n: int = 3
+        scores_df: pd.DataFrame, top_n: int = 3
     ) -> List[Tuple[str, int]]:
         """
         Identify top N capability dimensions based on scores.
@@ -323,14 +498,16 @@ class DataProcessor:
         Returns:
             List of tuples (dimension_name, score) sorted by score
         """
-        sorted_scores = scores_df.sort_values("スコア", ascending=False)
-        return [
-            (row["能力次元"], row["スコア"])
-            for _, row in sorted_scores.head(top_n).iterrows()
-        ]
+        return _select_ranked(
+            scores_df["スコア"].to_numpy(),
+            scores_df["能力次元"].to_numpy(),
+            top_n,
+            largest=True,
+        )
 
+    @staticmethod
     def identify_development_areas(
-        self, scores_df: pd.DataFrame, bottom_n: int = 2
+        scores_df: pd.DataFrame, bottom_n: int = 2
     ) -> List[Tuple[str, int]]:
         """
         Identify areas for development based on lowest scores.
@@ -342,8 +519,40 @@ class DataProcessor:
         Returns:
             List of tuples (dimension_name, score) sorted by score (lowest first)
         """
-        sorted_scores = scores_df.sort_values("スコア", ascending=True)
-        return [
-            (row["能力次元"], row["スコア"])
-            for _, row in sorted_scores.head(bottom_n).iterrows()
-        ]
+        return _select_ranked(
+            scores_df["スコア"].to_numpy(),
+            scores_df["能力次元"].to_numpy(),
+            bottom_n,
+            largest=False,
+        )
+
+    @staticmethod
+    def compute_all(
+        scores_df: pd.DataFrame, top_n: int = 3, bottom_n: int = 2
+    ) -> Dict[str, Any]:
+        """
+        Compute statistics, top strengths and development areas together.
+
+        The score and dimension columns are read out of the DataFrame once and
+        shared by all three results. Each ranking does its own stable sort,
+        since ties are kept in dimension order in both directions.
+
+        Args:
+            scores_df: DataFrame with capability scores
+            top_n: Number of top capabilities to return
+            bottom_n: Number of development areas to return
+
+        Returns:
+            Dictionary with "statistics", "top_strengths" and
+            "development_areas" entries
+        """
+        values = scores_df["スコア"].to_numpy()
+        dimensions = scores_df["能力次元"].to_numpy()
+
+        return {
+            "statistics": _statistics(values),
+            "top_strengths": _select_ranked(values, dimensions, top_n, largest=True),
+            "development_areas": _select_ranked(
+                values, dimensions, bottom_n, largest=False
+            ),
+        }
@@ -5,13 +5,207 @@ This module handles the creation of interactive visualizations
 for the Potential Insight Compass system using Plotly.
 """
 
-from typing import Dict, List, Optional, Tuple
+import copy
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
+from plotly.colors import make_colorscale
 from plotly.subplots import make_subplots
 
+from .data_processor import DataProcessor
+
+# Serialize figures with orjson (already a dependency), which encodes
+# numpy arrays natively instead of walking them in Python
+pio.json.config.default_engine = "orjson"
+
+# Number of figure specs kept by each ChartVisualizer
+FIGURE_CACHE_SIZE = 64
+
+# Capability dimensions in display order. DataProcessor builds the
+# "能力次元" column as a categorical with exactly these categories.
+_DIMENSIONS = DataProcessor.CAPABILITY_DIMENSIONS
+_DIMENSIONS_ARR = np.array(_DIMENSIONS, dtype=object)
+_DIMENSIONS_ARR.setflags(write=False)
+_DIMENSION_CODES = np.arange(len(_DIMENSIONS))
+
+# Japanese font settings for better rendering
+_FONT_FAMILY = "Arial, sans-serif"
+
+# Read-only styling constants, shared instead of rebuilt on every chart call.
+# Plotly deep-copies trace properties, so callers pass dict() copies of these.
+_COLOR_PALETTE = MappingProxyType(
+    {
+        "primary": "#1f77b4",
+        "secondary": "#ff7f0e",
+        "success": "#2ca02c",
+        "warning": "#d62728",
+        "info": "#9467bd",
+        "light": "#17becf",
+    }
+)
+_PRIMARY = _COLOR_PALETTE["primary"]
+_PRIMARY_FILLCOLOR_30 = "rgba(31, 119, 180, 0.3)"  # primary with 30% opacity
+_PRIMARY_LINE = MappingProxyType({"color": _PRIMARY, "width": 3})
+_PRIMARY_MARKER = MappingProxyType({"color": _PRIMARY, "size": 8})
+_PRIMARY_TEXTFONT = MappingProxyType(
+    {"size": 12, "color": _PRIMARY, "family": _FONT_FAMILY}
+)
+
+# Comparison series colors: RGBA fills with 20% opacity and matching lines
+_COMPARISON_FILLCOLORS = (
+    "rgba(31, 119, 180, 0.2)",  # primary with 20% opacity
+    "rgba(255, 127, 14, 0.2)",  # secondary with 20% opacity
+    "rgba(44, 160, 44, 0.2)",  # success with 20% opacity
+    "rgba(214, 39, 40, 0.2)",  # warning with 20% opacity
+)
+_COMPARISON_LINE_COLORS = (
+    _COLOR_PALETTE["primary"],
+    _COLOR_PALETTE["secondary"],
+    _COLOR_PALETTE["success"],
+    _COLOR_PALETTE["warning"],
+)
+
+# Layout defaults shared by every chart. The template holds only these
+# overrides and is layered on top of whatever template is the default when a
+# figure is built (importing streamlit makes its theme template the default).
+TEMPLATE_NAME = "compass"
+_TEMPLATE = go.layout.Template()
+_TEMPLATE.layout.update(
+    font=dict(family=_FONT_FAMILY),
+    title=dict(x=0.5, font=dict(size=18, family=_FONT_FAMILY)),
+    polar=dict(
+        radialaxis=dict(
+            visible=True,
+            tickmode="linear",
+            tick0=0,
+            dtick=2,
+            gridcolor="lightgray",
+            gridwidth=1,
+        ),
+        angularaxis=dict(
+            tickfont=dict(size=12, family=_FONT_FAMILY),
+            gridcolor="lightgray",
+            gridwidth=1,
+        ),
+    ),
+)
+pio.templates[TEMPLATE_NAME] = _TEMPLATE
+
+# Named colorscales resolved up front, since unvalidated traces send them as-is
+_VIRIDIS = make_colorscale(px.colors.sequential.Viridis)
+_PLASMA = make_colorscale(px.colors.sequential.Plasma)
+
+# Radar hover text; comparison traces prefix it with their label
+_HOVER_RADAR = "<b>%{theta}</b><br>スコア: %{r}/10<extra></extra>"
+
+# Prebuilt radar chart skeletons. Each call copies only the top level and
+# fills in the data, template and title; the nested dicts are shared, and
+# go.Figure deep-copies them, so they are never mutated.
+_RADAR_TRACE = {
+    "type": "scatterpolar",
+    "fill": "toself",
+    "fillcolor": _PRIMARY_FILLCOLOR_30,
+    "line": dict(_PRIMARY_LINE),
+    "marker": dict(_PRIMARY_MARKER),
+    "name": "能力スコア",
+    "hovertemplate": _HOVER_RADAR,
+}
+_RADAR_TEXT_TRACE = {
+    "type": "scatterpolar",
+    "mode": "text",
+    "textfont": dict(_PRIMARY_TEXTFONT),
+    "showlegend": False,
+    "hoverinfo": "skip",
+}
+_RADAR_LAYOUT = dict(
+    polar=dict(radialaxis=dict(range=[0, 10])),
+    showlegend=False,
+    width=600,
+    height=600,
+)
+
+
+def _template_name() -> str:
+    """Name of the current default template combined with the compass one."""
+    default = pio.templates.default
+    return f"{default}+{TEMPLATE_NAME}" if default else TEMPLATE_NAME
+
+
+@functools.lru_cache(maxsize=None)
+def _template_spec(name: str) -> Dict[str, Any]:
+    """
+    Resolve a template name to the dict that unvalidated figures embed.
+
+    Each combination is merged and validated once; figures built from the
+    result skip layout validation.
+
+    Args:
+        name: Template name, possibly "+"-combined (see _template_name)
+
+    Returns:
+        Template as a plain dict (shared, so treat it as read-only)
+    """
+    return pio.templates[name].to_plotly_json()
+
+
+def _base_layout() -> Dict[str, Any]:
+    """Layout entries shared by every chart, for the current default template."""
+    return {"template": _template_spec(_template_name())}
+
+
+def _dimension_labels(column: pd.Series) -> np.ndarray:
+    """
+    Return the capability dimension labels of a DataFrame column.
+
+    A categorical column holding every dimension once, in display order,
+    reuses the shared read-only _DIMENSIONS_ARR instead of a new array.
+
+    Args:
+        column: The "能力次元" column of a scores DataFrame
+
+    Returns:
+        Object array of dimension labels
+    """
+    if (
+        isinstance(column.dtype, pd.CategoricalDtype)
+        and tuple(column.cat.categories) == _DIMENSIONS
+        and np.array_equal(column.cat.codes.to_numpy(), _DIMENSION_CODES)
+    ):
+        return _DIMENSIONS_ARR
+    return column.to_numpy()
+
+
+def _fingerprint(kind: str, *parts: Any) -> bytes:
+    """
+    Hash a chart kind and its inputs into a figure cache key.
+
+    Args:
+        kind: Chart kind, so different charts never share a key
+        *parts: Arrays, strings and flags the figure is built from
+
+    Returns:
+        16-byte blake2b digest
+    """
+    h = hashlib.blake2b(kind.encode(), digest_size=16)
+    for part in parts:
+        if isinstance(part, np.ndarray) and part.dtype != object:
+            h.update(part.dtype.str.encode())
+            h.update(part.tobytes())
+        elif isinstance(part, np.ndarray):
+            h.update("\x1f".join(map(str, part.tolist())).encode())
+        else:
+            h.update(repr(part).encode())
+        h.update(b"\x00")
+    return h.digest()
+
 
 class ChartVisualizer:
     """
@@ -25,17 +219,46 @@ class ChartVisualizer:
 
     def __init__(self):
         """Initialize the chart visualizer."""
-        self.color_palette = {
-            "primary": "#1f77b4",
-            "secondary": "#ff7f0e",
-            "success": "#2ca02c",
-            "warning": "#d62728",
-            "info": "#9467bd",
-            "light": "#17becf",
-        }
+        self.color_palette = _COLOR_PALETTE
 
         # Japanese font settings for better rendering
-        self.font_family = "Arial, sans-serif"
+        self.font_family = _FONT_FAMILY
+
+        # Figure specs keyed by input fingerprint, least recently used first
+        self._figure_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._figure_cache_lock = threading.Lock()
+
+    def _cached_figure(self, key: bytes, build: Callable[[], go.Figure]) -> go.Figure:
+        """
+        Return the figure for a fingerprint, building it only on a cache miss.
+
+        Args:
+            key: Fingerprint of the figure inputs
+            build: Function that builds the figure
+
+        Returns:
+            Plotly figure object (a fresh copy that callers may modify)
+        """
+        # Figures embed the default template, so a new default needs new figures
+        key = _template_name().encode() + b"\x00" + key
+
+        with self._figure_cache_lock:
+            spec = self._figure_cache.get(key)
+            if spec is not None:
+                self._figure_cache.move_to_end(key)
+
+        if spec is not None:
+            # The spec is this builder's own serialized output, so skip re-validation
+            return go.Figure(spec, _validate=False)
+
+        fig = build()
+        with self._figure_cache_lock:
+            self._figure_cache[key] = fig.to_plotly_json()
+            self._figure_cache.move_to_end(key)
+            while len(self._figure_cache) > FIGURE_CACHE_SIZE:
+                self._figure_cache.popitem(last=False)
+
+        return fig
 
     def create_radar_chart(
         self,
@@ -52,83 +275,81 @@ class ChartVisualizer:
             show_values: Whether to show score values on the chart
 
         Returns:
-            Plotly figure object
+            Plotly figure object (a fresh copy that callers may modify)
         """
-        # Prepare data for radar chart
-        dimensions = scores_df["能力次元"].tolist()
-        scores = scores_df["スコア"].tolist()
+        dimensions = _dimension_labels(scores_df["能力次元"])
+        scores = scores_df["スコア"].to_numpy()
+
+        key = _fingerprint("radar", dimensions, scores, title, show_values)
+        return self._cached_figure(
+            key,
+            lambda: go.Figure(
+                self._radar_spec(dimensions, scores, title, show_values),
+                _validate=False,
+            ),
+        )
 
-        # Add the first dimension to the end to close the radar chart
-        dimensions_closed = dimensions + [dimensions[0]]
-        scores_closed = scores + [scores[0]]
+    def create_radar_spec(
+        self,
+        scores_df: pd.DataFrame,
+        title: str = "能力スコア レーダーチャート",
+        show_values: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Create the radar chart as a plain figure dict, without a go.Figure.
 
-        # Create radar chart
-        fig = go.Figure()
+        For callers that only serialize the chart (e.g. with plotly.io.to_json),
+        this skips building and validating the figure object.
 
-        fig.add_trace(
-            go.Scatterpolar(
-                r=scores_closed,
-                theta=dimensions_closed,
-                fill="toself",
-                fillcolor=f"rgba(31, 119, 180, 0.3)",  # RGBA format with 30% opacity
-                line=dict(color=self.color_palette["primary"], width=3),
-                marker=dict(color=self.color_palette["primary"], size=8),
-                name="能力スコア",
-                hovertemplate="<b>%{theta}</b><br>スコア: %{r}/10<extra></extra>",
+        Args:
+            scores_df: DataFrame with capability scores
+            title: Chart title
+            show_values: Whether to show score values on the chart
+
+        Returns:
+            Figure dict with "data" and "layout" entries, independent of
+            any other call's result
+        """
+        # _radar_spec shares its styling dicts, so hand out a private copy
+        return copy.deepcopy(
+            self._radar_spec(
+                _dimension_labels(scores_df["能力次元"]),
+                scores_df["スコア"].to_numpy(),
+                title,
+                show_values,
             )
         )
 
+    def _radar_spec(
+        self,
+        dimensions: np.ndarray,
+        scores: np.ndarray,
+        title: str,
+        show_values: bool,
+    ) -> Dict[str, Any]:
+        """Build the radar chart figure dict."""
+        # Add the first dimension to the end to close the radar chart
+        dimensions_closed = np.concatenate([dimensions, dimensions[:1]])
+        scores_closed = np.concatenate([scores, scores[:1]])
+
+        traces = [dict(_RADAR_TRACE, r=scores_closed, theta=dimensions_closed)]
+
         # Add score values as text annotations if requested
         if show_values:
-            # Alternative approach: Add text as separate traces instead of annotations
-            text_r = [
-                score + 0.8 for score in scores
-            ]  # Position text outside the data points
-            text_r_closed = text_r + [text_r[0]]  # Close the loop
-            text_values = [str(score) for score in scores] + [str(scores[0])]
-
-            fig.add_trace(
-                go.Scatterpolar(
-                    r=text_r_closed,
-                    theta=dimensions_closed,
-                    mode="text",
-                    text=text_values,
-                    textfont=dict(
-                        size=12,
-                        color=self.color_palette["primary"],
-                        family=self.font_family,
-                    ),
-                    showlegend=False,
-                    hoverinfo="skip",
-                )
+            # Alternative approach: Add text as separate traces instead of annotations.
+            # Labels are placed for all points at once and skip the closing
+            # point, which would draw a second label over the first dimension.
+            # Position text outside the points (float32 rather than the
+            # float64 that int scores + 0.8 would promote to)
+            text_r = scores.astype(np.float32) + np.float32(0.8)
+            text_values = np.char.mod("%d", scores)
+
+            traces.append(
+                dict(_RADAR_TEXT_TRACE, r=text_r, theta=dimensions, text=text_values)
             )
 
-        # Update layout
-        fig.update_layout(
-            polar=dict(
-                radialaxis=dict(
-                    visible=True,
-                    range=[0, 10],
-                    tickmode="linear",
-                    tick0=0,
-                    dtick=2,
-                    gridcolor="lightgray",
-                    gridwidth=1,
-                ),
-                angularaxis=dict(
-                    tickfont=dict(size=12, family=self.font_family),
-                    gridcolor="lightgray",
-                    gridwidth=1,
-                ),
-            ),
-            title=dict(text=title, x=0.5, font=dict(size=18, family=self.font_family)),
-            showlegend=False,
-            width=600,
-            height=600,
-            font=dict(family=self.font_family),
-        )
-
-        return fig
+        layout = dict(_RADAR_LAYOUT, **_base_layout(), title=dict(text=title))
+        return {"data": traces, "layout": layout}
 
     def create_bar_chart(
         self,
@@ -147,74 +368,85 @@ class ChartVisualizer:
         Returns:
             Plotly figure object
         """
-        # Sort by score for better visualization
-        sorted_df = scores_df.sort_values(
-            "スコア", ascending=False if not horizontal else True
+        values = scores_df["スコア"].to_numpy()
+        dimensions = _dimension_labels(scores_df["能力次元"])
+
+        key = _fingerprint("bar", dimensions, values, title, horizontal)
+        return self._cached_figure(
+            key,
+            lambda: go.Figure(
+                self._bar_spec(dimensions, values, title, horizontal),
+                _validate=False,
+            ),
         )
 
+    def _bar_spec(
+        self,
+        dimensions: np.ndarray,
+        values: np.ndarray,
+        title: str,
+        horizontal: bool,
+    ) -> Dict[str, Any]:
+        """Build the bar chart figure dict."""
+        # Sort by score for better visualization (ascending when horizontal),
+        # skipping the sort when the scores already arrive in that order
+        keys = values if horizontal else -values
+        if not np.all(np.diff(keys) >= 0):
+            order = np.argsort(keys, kind="stable")
+            values = values[order]
+            dimensions = dimensions[order]
+
         if horizontal:
-            fig = go.Figure(
-                data=[
-                    go.Bar(
-                        y=sorted_df["能力次元"],
-                        x=sorted_df["スコア"],
-                        orientation="h",
-                        marker=dict(
-                            color=sorted_df["スコア"],
-                            colorscale="viridis",
-                            showscale=False,
-                        ),
-                        text=sorted_df["スコア"],
-                        textposition="inside",
-                        hovertemplate="<b>%{y}</b><br>スコア: %{x}/10<extra></extra>",
-                    )
-                ]
+            trace = dict(
+                type="bar",
+                y=dimensions,
+                x=values,
+                orientation="h",
+                marker=dict(
+                    color=values,
+                    colorscale=_VIRIDIS,
+                    showscale=False,
+                ),
+                text=values,
+                textposition="inside",
+                hovertemplate="<b>%{y}</b><br>スコア: %{x}/10<extra></extra>",
             )
 
-            fig.update_layout(
-                xaxis_title="スコア",
-                yaxis_title="能力次元",
+            layout = dict(
+                xaxis=dict(title=dict(text="スコア")),
+                yaxis=dict(title=dict(text="能力次元"), range=[0, 10]),
                 height=400,  # 横向きの場合は400pxに設定
                 margin=dict(
                     t=60, b=60, l=120, r=60
                 ),  # 左マージンを大きくして能力次元名の表示を改善
             )
         else:
-            fig = go.Figure(
-                data=[
-                    go.Bar(
-                        x=sorted_df["能力次元"],
-                        y=sorted_df["スコア"],
-                        marker=dict(
-                            color=sorted_df["スコア"],
-                            colorscale="viridis",
-                            showscale=False,
-                        ),
-                        text=sorted_df["スコア"],
-                        textposition="outside",
-                        hovertemplate="<b>%{x}</b><br>スコア: %{y}/10<extra></extra>",
-                    )
-                ]
+            trace = dict(
+                type="bar",
+                x=dimensions,
+                y=values,
+                marker=dict(
+                    color=values,
+                    colorscale=_VIRIDIS,
+                    showscale=False,
+                ),
+                text=values,
+                textposition="outside",
+                hovertemplate="<b>%{x}</b><br>スコア: %{y}/10<extra></extra>",
             )
 
-            fig.update_layout(
-                xaxis_title="能力次元",
-                yaxis_title="スコア",
-                xaxis_tickangle=-45,
+            layout = dict(
+                xaxis=dict(title=dict(text="能力次元"), tickangle=-45),
+                yaxis=dict(title=dict(text="スコア"), range=[0, 10]),
                 height=500,  # 縦向きの場合は500pxに設定
                 margin=dict(
                     t=80, b=120, l=80, r=60
                 ),  # 下マージンを大きくして軸ラベルの表示を改善
             )
 
-        fig.update_layout(
-            title=dict(text=title, x=0.5, font=dict(size=18, family=self.font_family)),
-            yaxis=dict(range=[0, 10]),
-            font=dict(family=self.font_family),
-            showlegend=False,
-        )
+        layout.update(_base_layout(), title=dict(text=title), showlegend=False)
 
-        return fig
+        return {"data": [trace], "layout": layout}
 
     def create_comparison_chart(
         self,
@@ -233,36 +465,59 @@ class ChartVisualizer:
         Returns:
             Plotly figure object
         """
-        fig = go.Figure()
-
-        # RGBA color values for transparency
-        rgba_colors = [
-            "rgba(31, 119, 180, 0.2)",  # primary with 20% opacity
-            "rgba(255, 127, 14, 0.2)",  # secondary with 20% opacity
-            "rgba(44, 160, 44, 0.2)",  # success with 20% opacity
-            "rgba(214, 39, 40, 0.2)",  # warning with 20% opacity
+        series = [
+            (
+                _dimension_labels(scores_df["能力次元"]),
+                scores_df["スコア"].to_numpy(),
+            )
+            for scores_df in scores_df_list
         ]
 
-        line_colors = [
-            self.color_palette["primary"],
-            self.color_palette["secondary"],
-            self.color_palette["success"],
-            self.color_palette["warning"],
-        ]
+        key = _fingerprint(
+            "comparison", *(a for pair in series for a in pair), list(labels), title
+        )
+        return self._cached_figure(
+            key, lambda: self._build_comparison(series, labels, title)
+        )
+
+    def _build_comparison(
+        self,
+        series: List[Tuple[np.ndarray, np.ndarray]],
+        labels: List[str],
+        title: str,
+    ) -> go.Figure:
+        """Build the comparison radar figure for create_comparison_chart."""
+        # Close every polygon in one (L, N) -> (L, N + 1) array operation when
+        # all series have the same number of dimensions
+        if len({len(scores) for _, scores in series}) == 1:
+            scores_mat = np.stack([scores for _, scores in series])
+            scores_closed_all = np.concatenate([scores_mat, scores_mat[:, :1]], axis=1)
+        else:
+            scores_closed_all = [
+                np.concatenate([scores, scores[:1]]) for _, scores in series
+            ]
 
-        for i, (scores_df, label) in enumerate(zip(scores_df_list, labels)):
-            dimensions = scores_df["能力次元"].tolist()
-            scores = scores_df["スコア"].tolist()
+        # Series usually share one dimension array; close each distinct one once
+        closed_dimensions: Dict[int, np.ndarray] = {}
 
-            # Close the radar chart
-            dimensions_closed = dimensions + [dimensions[0]]
-            scores_closed = scores + [scores[0]]
+        hovertemplates = [f"<b>{label}</b><br>{_HOVER_RADAR}" for label in labels]
 
-            fill_color = rgba_colors[i % len(rgba_colors)]
-            line_color = line_colors[i % len(line_colors)]
+        # Build every trace up front and hand them to Plotly in one batch
+        traces = []
+        for i, ((dimensions, _), scores_closed, label, hovertemplate) in enumerate(
+            zip(series, scores_closed_all, labels, hovertemplates)
+        ):
+            dimensions_closed = closed_dimensions.get(id(dimensions))
+            if dimensions_closed is None:
+                dimensions_closed = np.concatenate([dimensions, dimensions[:1]])
+                closed_dimensions[id(dimensions)] = dimensions_closed
 
-            fig.add_trace(
-                go.Scatterpolar(
+            fill_color = _COMPARISON_FILLCOLORS[i % len(_COMPARISON_FILLCOLORS)]
+            line_color = _COMPARISON_LINE_COLORS[i % len(_COMPARISON_LINE_COLORS)]
+
+            traces.append(
+                dict(
+                    type="scatterpolar",
                     r=scores_closed,
                     theta=dimensions_closed,
                     fill="toself",
@@ -270,36 +525,20 @@ class ChartVisualizer:
                     line=dict(color=line_color, width=2),
                     marker=dict(color=line_color, size=6),
                     name=label,
-                    hovertemplate=f"<b>{label}</b><br><b>%{{theta}}</b><br>スコア: %{{r}}/10<extra></extra>",
+                    hovertemplate=hovertemplate,
                 )
             )
 
-        fig.update_layout(
-            polar=dict(
-                radialaxis=dict(
-                    visible=True,
-                    range=[0, 10],
-                    tickmode="linear",
-                    tick0=0,
-                    dtick=2,
-                    gridcolor="lightgray",
-                    gridwidth=1,
-                ),
-                angularaxis=dict(
-                    tickfont=dict(size=12, family=self.font_family),
-                    gridcolor="lightgray",
-                    gridwidth=1,
-                ),
-            ),
-            title=dict(text=title, x=0.5, font=dict(size=18, family=self.font_family)),
+        layout = dict(
+            _base_layout(),
+            title=dict(text=title),
+            polar=dict(radialaxis=dict(range=[0, 10])),
             showlegend=True,
             legend=dict(
                 orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1
             ),
-            font=dict(family=self.font_family),
         )
-
-        return fig
+        return go.Figure(data=traces, layout=layout, _validate=False)
 
     def create_distribution_chart(self, scores_df: pd.DataFrame) -> go.Figure:
         """
@@ -311,8 +550,13 @@ class ChartVisualizer:
         Returns:
             Plotly figure object
         """
-        scores = scores_df["スコア"].values
+        scores = scores_df["スコア"].to_numpy()
+
+        key = _fingerprint("distribution", scores)
+        return self._cached_figure(key, lambda: self._build_distribution(scores))
 
+    def _build_distribution(self, scores: np.ndarray) -> go.Figure:
+        """Build the distribution figure for create_distribution_chart."""
         fig = make_subplots(
             rows=2,
             cols=1,
@@ -320,41 +564,76 @@ class ChartVisualizer:
             vertical_spacing=0.15,
         )
 
-        # Histogram
+        # Histogram, binned here so only the counts are sent to the browser:
+        # one unit-wide bar per integer score 0-10 (0 = missing dimension)
+        counts, edges = np.histogram(scores, bins=11, range=(-0.5, 10.5))
+        centers = 0.5 * (edges[:-1] + edges[1:])
         fig.add_trace(
-            go.Histogram(
-                x=scores,
-                nbinsx=10,
-                marker=dict(color=self.color_palette["primary"], opacity=0.7),
+            go.Bar(
+                x=centers,
+                y=counts,
+                width=edges[1] - edges[0],
+                marker=dict(color=_PRIMARY, opacity=0.7),
                 name="頻度",
             ),
             row=1,
             col=1,
         )
 
-        # Box plot
+        # Box plot from precomputed quartiles and 1.5 IQR whisker fences;
+        # min, quartiles and max come from a single np.quantile call
+        minimum, q1, median, q3, maximum = np.quantile(
+            scores, [0.0, 0.25, 0.5, 0.75, 1.0]
+        )
+        iqr = q3 - q1
+        low, high = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+        if low <= minimum and maximum <= high:
+            lowerfence, upperfence = minimum, maximum
+        else:
+            inliers = scores[(scores >= low) & (scores <= high)]
+            lowerfence, upperfence = inliers.min(), inliers.max()
         fig.add_trace(
             go.Box(
-                y=scores, marker=dict(color=self.color_palette["primary"]), name="分布"
+                x=["分布"],
+                q1=[q1],
+                median=[median],
+                q3=[q3],
+                lowerfence=[lowerfence],
+                upperfence=[upperfence],
+                marker=dict(color=_PRIMARY),
+                name="分布",
             ),
             row=2,
             col=1,
         )
 
+        # Without raw samples the box cannot draw outliers, so add them here
+        outliers = scores[(scores < lowerfence) | (scores > upperfence)]
+        if outliers.size:
+            fig.add_trace(
+                go.Scatter(
+                    x=np.full(outliers.size, "分布", dtype=object),
+                    y=outliers,
+                    mode="markers",
+                    marker=dict(color=_PRIMARY),
+                    name="分布",
+                    hoverinfo="y",
+                ),
+                row=2,
+                col=1,
+            )
+
         fig.update_layout(
-            title=dict(
-                text="能力スコア 分布分析",
-                x=0.5,
-                font=dict(size=18, family=self.font_family),
-            ),
+            template=_template_name(),
+            title_text="能力スコア 分布分析",
             showlegend=False,
-            font=dict(family=self.font_family),
+            # Subplot axis titles set in the same call (row 1: xaxis/yaxis,
+            # row 2: xaxis2/yaxis2) instead of one update per axis
+            xaxis_title_text="スコア",
+            yaxis_title_text="頻度",
+            yaxis2_title_text="スコア",
         )
 
-        fig.update_xaxes(title_text="スコア", row=1, col=1)
-        fig.update_yaxes(title_text="頻度", row=1, col=1)
-        fig.update_yaxes(title_text="スコア", row=2, col=1)
-
         return fig
 
     def create_summary_metrics_chart(self, statistics: Dict[str, float]) -> go.Figure:
@@ -367,31 +646,34 @@ class ChartVisualizer:
         Returns:
             Plotly figure object
         """
-        metrics = list(statistics.keys())
-        values = list(statistics.values())
-
-        fig = go.Figure(
-            data=[
-                go.Bar(
-                    x=metrics,
-                    y=values,
-                    marker=dict(color=values, colorscale="plasma", showscale=False),
-                    text=[f"{v:.2f}" for v in values],
-                    textposition="outside",
-                    hovertemplate="<b>%{x}</b><br>値: %{y:.2f}<extra></extra>",
-                )
-            ]
+        key = _fingerprint("summary", statistics)
+        return self._cached_figure(
+            key, lambda: self._build_summary_metrics(statistics)
         )
 
-        fig.update_layout(
-            title=dict(
-                text="統計サマリー", x=0.5, font=dict(size=18, family=self.font_family)
-            ),
-            xaxis_title="統計指標",
-            yaxis_title="値",
-            xaxis_tickangle=-45,
-            font=dict(family=self.font_family),
+    def _build_summary_metrics(self, statistics: Dict[str, float]) -> go.Figure:
+        """Build the summary statistics figure for create_summary_metrics_chart."""
+        metrics = np.array(list(statistics.keys()), dtype=object)
+        values = np.fromiter(
+            statistics.values(), dtype=np.float32, count=len(statistics)
+        )
+
+        trace = dict(
+            type="bar",
+            x=metrics,
+            y=values,
+            marker=dict(color=values, colorscale=_PLASMA, showscale=False),
+            text=np.char.mod("%.2f", values),
+            textposition="outside",
+            hovertemplate="<b>%{x}</b><br>値: %{y:.2f}<extra></extra>",
+        )
+
+        layout = dict(
+            _base_layout(),
+            title=dict(text="統計サマリー"),
+            xaxis=dict(title=dict(text="統計指標"), tickangle=-45),
+            yaxis=dict(title=dict(text="値")),
             showlegend=False,
         )
 
-        return fig
+        return go.Figure(data=[trace], layout=layout, _validate=False)
@@ -4,12 +4,16 @@ Unit tests for the AI Analyzer module.
 This module contains tests for the AIAnalyzer class and related functionality.
 """
 
+import asyncio
+import copy
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 import json
 import os
 import sys
 
+from google.api_core import exceptions as google_exceptions
+
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
@@ -20,11 +24,15 @@ from src.data_processor import DataProcessor
 class TestAIAnalyzer(unittest.TestCase):
     """Test cases for AIAnalyzer class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up the analyzer shared by all tests."""
         # Mock API key for testing
-        self.test_api_key = "test_api_key_123"
+        cls.test_api_key = "test_api_key_123"
+        cls.analyzer = AIAnalyzer(api_key=cls.test_api_key)
 
+    def setUp(self):
+        """Set up test fixtures."""
         # Sample valid response data
         self.sample_response_data = {
             "qualitative_analysis": {
@@ -62,44 +70,34 @@ class TestAIAnalyzer(unittest.TestCase):
 
     def test_input_validation_empty_text(self):
         """Test input validation with empty text."""
-        analyzer = AIAnalyzer(api_key=self.test_api_key)
-
-        is_valid, error_msg = analyzer.validate_input("")
+        is_valid, error_msg = self.analyzer.validate_input("")
         self.assertFalse(is_valid)
         self.assertIn("空です", error_msg)
 
     def test_input_validation_short_text(self):
         """Test input validation with too short text."""
-        analyzer = AIAnalyzer(api_key=self.test_api_key)
-
-        is_valid, error_msg = analyzer.validate_input("短い")
+        is_valid, error_msg = self.analyzer.validate_input("短い")
         self.assertFalse(is_valid)
         self.assertIn("短すぎます", error_msg)
 
     def test_input_validation_long_text(self):
         """Test input validation with too long text."""
-        analyzer = AIAnalyzer(api_key=self.test_api_key)
-
         long_text = "あ" * 10001  # Over 10,000 characters
-        is_valid, error_msg = analyzer.validate_input(long_text)
+        is_valid, error_msg = self.analyzer.validate_input(long_text)
         self.assertFalse(is_valid)
         self.assertIn("長すぎます", error_msg)
 
     def test_input_validation_valid_text(self):
         """Test input validation with valid text."""
-        analyzer = AIAnalyzer(api_key=self.test_api_key)
-
         valid_text = "これは有効なテストテキストです。十分な長さがあります。"
-        is_valid, error_msg = analyzer.validate_input(valid_text)
+        is_valid, error_msg = self.analyzer.validate_input(valid_text)
         self.assertTrue(is_valid)
         self.assertEqual(error_msg, "")
 
     def test_parse_response_valid_json(self):
         """Test parsing valid JSON response."""
-        analyzer = AIAnalyzer(api_key=self.test_api_key)
-
         json_response = json.dumps(self.sample_response_data, ensure_ascii=False)
-        parsed_data = analyzer._parse_response(json_response)
+        parsed_data = self.analyzer._parse_response(json_response)
 
         self.assertEqual(
             parsed_data["qualitative_analysis"]["strengths"],
@@ -108,38 +106,104 @@ class TestAIAnalyzer(unittest.TestCase):
 
     def test_parse_response_with_markdown_wrapper(self):
         """Test parsing JSON response wrapped in markdown."""
-        analyzer = AIAnalyzer(api_key=self.test_api_key)
-
         json_response = (
             f"```json\n{json.dumps(self.sample_response_data, ensure_ascii=False)}\n```"
         )
-        parsed_data = analyzer._parse_response(json_response)
+        parsed_data = self.analyzer._parse_response(json_response)
 
         self.assertEqual(len(parsed_data["qualitative_analysis"]["strengths"]), 5)
 
     def test_validate_response_structure_valid(self):
         """Test response structure validation with valid data."""
-        analyzer = AIAnalyzer(api_key=self.test_api_key)
-
         # Should not raise any exception
-        analyzer._validate_response_structure(self.sample_response_data)
+        self.analyzer._validate_response_structure(self.sample_response_data)
 
     def test_validate_response_structure_missing_keys(self):
         """Test response structure validation with missing keys."""
-        analyzer = AIAnalyzer(api_key=self.test_api_key)
-
         invalid_data = {"qualitative_analysis": {}}  # Missing quantitative_scores
 
         with self.assertRaises(ValueError) as context:
-            analyzer._validate_response_structure(invalid_data)
+            self.analyzer._validate_response_structure(invalid_data)
 
         self.assertIn("quantitative_scores", str(context.exception))
 
+    def test_analyze_batch_preserves_order(self):
+        """Test batch analysis returns results in input order."""
+        # Shallow copy, since this test replaces the model
+        analyzer = copy.copy(self.analyzer)
+
+        responses = []
+        for score in (3, 7):
+            data = copy.deepcopy(self.sample_response_data)
+            data["quantitative_scores"]["継続・集中力"] = score
+            responses.append(Mock(text=json.dumps(data, ensure_ascii=False)))
+
+        analyzer.model = Mock()
+        analyzer.model.generate_content_async = AsyncMock(side_effect=responses)
+
+        texts = [
+            "一人で黙々と作業するのが好きです。",
+            "新しいことにすぐ飛びつくが飽きっぽいです。",
+        ]
+        results = asyncio.run(analyzer.analyze_batch(texts))
+
+        self.assertEqual(
+            [result.quantitative_scores["継続・集中力"] for result in results], [3, 7]
+        )
+
+    def test_analyze_text_resets_stream_on_retry(self):
+        """Test retry_callback runs before a retry so partial output can be dropped."""
+        # Shallow copy, since this test replaces the model
+        analyzer = copy.copy(self.analyzer)
+        raw = json.dumps(self.sample_response_data, ensure_ascii=False)
+
+        def failed_stream():
+            yield Mock(text=raw[:10])
+            raise google_exceptions.ServiceUnavailable("unavailable")
+
+        analyzer.model = Mock()
+        analyzer.model.generate_content = Mock(
+            side_effect=[failed_stream(), iter([Mock(text=raw)])]
+        )
+
+        events = []
+        with patch("src.ai_analyzer.time.sleep"):
+            result = analyzer.analyze_text(
+                "一人で黙々と作業するのが好きです。",
+                chunk_callback=lambda chunk: events.append(("chunk", chunk)),
+                retry_callback=lambda attempt: events.append(("retry", attempt)),
+            )
+
+        self.assertEqual(
+            events, [("chunk", raw[:10]), ("retry", 2), ("chunk", raw)]
+        )
+        self.assertEqual(result.raw_response, raw)
+
+    def test_analyze_text_retries_invalid_response(self):
+        """Test a response failing validation is retried rather than fatal."""
+        # Shallow copy, since this test replaces the model
+        analyzer = copy.copy(self.analyzer)
+        invalid_data = copy.deepcopy(self.sample_response_data)
+        invalid_data["qualitative_analysis"]["strengths"].pop()
+        raw = json.dumps(self.sample_response_data, ensure_ascii=False)
+
+        analyzer.model = Mock()
+        analyzer.model.generate_content = Mock(
+            side_effect=[
+                iter([Mock(text=json.dumps(invalid_data, ensure_ascii=False))]),
+                iter([Mock(text=raw)]),
+            ]
+        )
+
+        with patch("src.ai_analyzer.time.sleep"):
+            result = analyzer.analyze_text("一人で黙々と作業するのが好きです。")
+
+        self.assertEqual(analyzer.model.generate_content.call_count, 2)
+        self.assertEqual(result.raw_response, raw)
+
     def test_get_capability_dimensions(self):
         """Test getting capability dimensions."""
-        analyzer = AIAnalyzer(api_key=self.test_api_key)
-
-        dimensions = analyzer.get_capability_dimensions()
+        dimensions = self.analyzer.get_capability_dimensions()
 
         expected_dimensions = [
             "継続・集中力",
@@ -184,6 +248,13 @@ class TestDataProcessor(unittest.TestCase):
 
         self.assertEqual(processed, "本当に！そうですか？")
 
+    def test_preprocess_text_quote_normalization(self):
+        """Test text preprocessing with smart quote normalization."""
+        input_text = "\u201cはい\u201dと\u2018答えた\u2019"
+        processed = self.processor.preprocess_text(input_text)
+
+        self.assertEqual(processed, "\"はい\"と'答えた'")
+
     def test_create_scores_dataframe(self):
         """Test creating scores DataFrame."""
         df = self.processor.create_scores_dataframe(self.sample_scores)
@@ -193,12 +264,68 @@ class TestDataProcessor(unittest.TestCase):
         self.assertTrue("スコア" in df.columns)
         self.assertTrue("最大値" in df.columns)
         self.assertTrue("パーセンテージ" in df.columns)
+        self.assertEqual(df["能力次元"].dtype.name, "category")
 
         # Check if percentages are calculated correctly
         first_row = df.iloc[0]
         expected_percentage = (first_row["スコア"] / 10) * 100
         self.assertEqual(first_row["パーセンテージ"], expected_percentage)
 
+    def test_compute_all(self):
+        """Test computing statistics and rankings in one call."""
+        df = self.processor.create_scores_dataframe(self.sample_scores)
+
+        summary = self.processor.compute_all(df)
+
+        self.assertEqual(
+            summary["statistics"], self.processor.calculate_statistics(df)
+        )
+        self.assertEqual(summary["top_strengths"][0], ("論理・分析力", 9))
+        self.assertEqual(len(summary["top_strengths"]), 3)
+        self.assertEqual(summary["development_areas"][0], ("共感・協調性", 6))
+        self.assertEqual(len(summary["development_areas"]), 2)
+
+    def test_rankings_break_ties_in_dimension_order(self):
+        """Test tied scores keep dimension order across the cut-off."""
+        tied_scores = {
+            "継続・集中力": 5,
+            "実行・行動力": 9,
+            "共感・協調性": 5,
+            "論理・分析力": 2,
+            "創造・発想力": 8,
+            "計画・堅実性": 5,
+        }
+        df = self.processor.create_scores_dataframe(tied_scores)
+
+        self.assertEqual(
+            self.processor.identify_top_strengths(df),
+            [("実行・行動力", 9), ("創造・発想力", 8), ("継続・集中力", 5)],
+        )
+        self.assertEqual(
+            self.processor.identify_development_areas(df),
+            [("論理・分析力", 2), ("継続・集中力", 5)],
+        )
+
+    def test_export_to_json_quantitative_scores(self):
+        """Test JSON export keeps scores as a dimension-to-score mapping."""
+        analysis_result = AnalysisResult(
+            strengths=["強み1", "強み2", "強み3", "強み4", "強み5"],
+            potential_jobs=[{"job_title": "職業1", "reason": "理由1"}],
+            quantitative_scores=self.sample_scores,
+            raw_response="{}",
+            processing_time=1.5,
+        )
+        processed_data = self.processor.process_analysis_result(
+            "これは有効なテストテキストです。", analysis_result
+        )
+
+        exported = json.loads(self.processor.export_to_json(processed_data))
+
+        self.assertEqual(exported["quantitative_scores"], self.sample_scores)
+        self.assertEqual(
+            list(exported["quantitative_scores"]), list(self.sample_scores)
+        )
+
     def test_validate_analysis_data_valid(self):
         """Test analysis data validation with valid data."""
         valid_data = {
@@ -230,6 +357,40 @@ class TestDataProcessor(unittest.TestCase):
         self.assertFalse(is_valid)
         self.assertTrue(len(errors) > 0)
 
+    def test_validate_analysis_data_fast_fail(self):
+        """Test analysis data validation stops at the first error."""
+        invalid_data = {
+            "qualitative_analysis": {
+                "strengths": ["強み1", "強み2"],
+                "potential_jobs": [],
+            }
+        }
+
+        is_valid, errors = self.processor.validate_analysis_data(
+            invalid_data, fast_fail=True
+        )
+        self.assertFalse(is_valid)
+        self.assertEqual(len(errors), 1)
+
+    def test_create_scores_accepts_integral_floats(self):
+        """Test integral float scores are stored as integers."""
+        scores = dict(self.sample_scores)
+        scores["論理・分析力"] = 9.0
+
+        result = self.processor.create_scores(scores)
+
+        self.assertEqual(result.to_dict(), self.sample_scores)
+
+    def test_create_scores_rejects_lossy_values(self):
+        """Test scores that int8 storage would alter raise ValueError."""
+        for score in (7.9, 300, -1):
+            scores = dict(self.sample_scores)
+            scores["論理・分析力"] = score
+            with self.subTest(score=score):
+                with self.assertRaises(ValueError) as context:
+                    self.processor.create_scores_dataframe(scores)
+                self.assertIn("論理・分析力", str(context.exception))
+
 
 if __name__ == "__main__":
     unittest.main()